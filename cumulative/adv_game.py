@@ -1,19 +1,33 @@
-"""Adventure game clues.
+"""Adventure game.
 
-This module provides a small, reusable `clues` list used by the adventure game.
-Each entry is a one-sentence hint about a past event and begins with "There is a...".
+Castle rooms, encounters, and the play loop. The shared clue data and
+random-selection helpers live in `sense_clues_core` at the repository root.
 """
-from enum import Enum
+import functools
+import os
+import random
+import sys
+from enum import IntEnum
 from abc import ABC, abstractmethod
 
+# Make the repository root importable whether this file is run as a script
+# (python adventure/adv_game.py) or imported from elsewhere.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sense_clues_core import (
+	clues,
+	sense_exp,
+	RandomItemSelector,
+	SenseClueGenerator,
+	get_sense_clue_generator,
+	_prompt,
+)
 
-class encounter_outcome(Enum):
+
+class EncounterOutcome(IntEnum):
 	CONTINUE = 1
 	END = 2
 
-# Preferred, PEP8-friendly name for use across the codebase.
-EncounterOutcome = encounter_outcome
-
 
 class Encounter(ABC):
 	"""Abstract base class for encounters.
@@ -30,153 +44,14 @@ class Encounter(ABC):
 		"""
 		raise NotImplementedError
 
-clues = [
-	"There is a smudge of dried ink on the underside of the table.",
-	"There is a faint scorch on the carpet as if something hot had been placed there.",
-	"There is a single muddy footprint pressed into the rug's fringe.",
-	"There is a scrap of paper folded three times and tucked into the baseboard.",
-	"There is a whisper of perfume that doesn't match any occupant's clothing.",
-	"There is a hidden latch behind the bookshelf, its edges recently worn.",
-	"There is a streak of crimson along the windowsill that has dried a while.",
-	"There is a child's toy, intact but abandoned, under the radiator.",
-	"There is a calendar with one day circled and the ink smudged by a trembling hand.",
-	"There is a loose floorboard with a small hollow stamped into dust beneath it.",
-]
-
-sense_exp = [
-	"You see torchlight pooling along the flagstones, though no torch burns nearby.",
-	"You hear the slow turning of gears somewhere deep in the wall, patient and eternal.",
-	"You smell cold iron mixed with old beeswax and something floral that has lingered for years.",
-	"You feel the carved stone hum faintly beneath your fingertips, as if remembering a name.",
-	"You sense the room holding its breath, a quiet pressure that makes your heartbeat louder.",
-	"You see motes of dust dancing in a shaft of moonlight that slices through a narrow slit.",
-	"You hear a draped curtain stir though the air is still, like the echo of a passing cloak.",
-	"You smell smoke and melted wax threaded through the tapestry's weave.",
-	"You feel a chill run along the baseboard as if footsteps passed by moments ago.",
-	"You see a shadow pause in the corner, not quite matching the shape of anything known.",
-	"You hear a faint, off-key melody humming from behind a sealed door.",
-	"You sense something familiar and foreign at once, a memory that belongs to someone else.",
-]
-
-# Try importing RandomItemSelector if this module is re-used elsewhere. If the
-# import would fail (e.g., during initial module load in the same file), fall
-# back to `None` — the class is defined later in this module and will be
-# available by the time users import the module normally.
-try:
-	from adventure.adv_game import RandomItemSelector
-except Exception:
-	RandomItemSelector = None
-
-import random
-
-
-class RandomItemSelector:
-	"""Select random items without immediate repetition.
-
-	- items: list of available items (kept in insertion order)
-	- used_items: list of items that have already been selected
-
-	Methods
-	- add_item(item): append a new item to the pool
-	- pull_random_item(): return a random unused item, mark it used; when all
-	  items have been used, the used list is cleared and selection resumes.
-	- reset(): clear the used_items list so all items are available again.
-	"""
-
-	def __init__(self, items=None):
-		# store a shallow copy so external mutations don't affect internal state
-		self.items = list(items) if items else []
-		self.used_items = []
-
-	def add_item(self, item):
-		"""Add a new item to the selection pool.
-
-		The item will be available immediately for selection unless it's already
-		present in the pool. Duplicates are allowed to support weighted selection.
-		"""
-		self.items.append(item)
-
-	def pull_random_item(self):
-		"""Return a random item that hasn't been used yet.
-
-		If all items have been used, reset `used_items` to allow reuse.
-		If there are no items at all, return None.
-		"""
-		if not self.items:
-			# Nothing to choose from
-			self.used_items = []
-			return None
-
-		# Build set of available indices for faster checks if lists grow large
-		available_indices = [i for i in range(len(self.items)) if i not in
-							 {self.items.index(x) for x in self.used_items if x in self.items}]
-
-		# If nothing available, reset used_items and recompute available indices
-		if not available_indices:
-			self.reset()
-			available_indices = list(range(len(self.items)))
-
-		choice_idx = random.choice(available_indices)
-		choice = self.items[choice_idx]
-		self.used_items.append(choice)
-		return choice
-
-	def reset(self):
-		"""Make all items available for selection again by clearing used_items."""
-		self.used_items.clear()
-
-
-class SenseClueGenerator:
-	"""Singleton generator that combines a clue and a sensory expression.
-
-	Uses two RandomItemSelector instances: one for `clues` and one for `sense_exp`.
-	The singleton is stored in the class variable `_instance`.
-	"""
-
-	_instance = None
-
-	def __new__(cls):
-		if cls._instance is None:
-			cls._instance = super().__new__(cls)
-
-			# Ensure we have a selector class available. If the earlier import
-			# failed, the local RandomItemSelector defined above will be used.
-			selector_cls = RandomItemSelector if RandomItemSelector is not None else RandomItemSelector
-
-			# Initialize selectors using module-level lists
-			cls._instance.clue_selector = selector_cls(clues)
-			cls._instance.sense_selector = selector_cls(sense_exp)
-
-		return cls._instance
-
-	def get_senseclue(self):
-		"""Pull one clue and one sensory sentence and return them combined.
-
-		Example output: "You hear a curtain stir though the air is still. There is a scrap of paper..."
-		"""
-		clue = self.clue_selector.pull_random_item()
-		sense = self.sense_selector.pull_random_item()
-
-		if clue and sense:
-			return f"{sense} {clue}"
-		return clue or sense or ""
-
-	def pull_random_item(self):
-		"""Compatibility proxy: return the same combined string as `get_senseclue`.
-
-		This method exists so callers that expect a `pull_random_item` method can
-		call it directly on the generator instance.
-		"""
-		return self.get_senseclue()
-
 
 
 class DefaultEncounter(Encounter):
 	"""Simple default encounter that prints a combined sense+clue and continues."""
 
 	def __init__(self):
-		# instantiate the singleton SenseClueGenerator
-		self.scg = SenseClueGenerator()
+		# bind the shared singleton SenseClueGenerator
+		self.scg = get_sense_clue_generator()
 
 	def run_encounter(self) -> EncounterOutcome:
 		# pull a combined sensory+clue string and print it
@@ -196,6 +71,19 @@ class TreasureEncounter(Encounter):
 
 
 
+def _duel(player_idx, wizard_idx):
+	"""Numeric spell-duel outcome: 1 if the player wins, -1 if the wizard wins, 0 on a tie.
+
+	Pure integer arithmetic over positions in the five-spell cycle, so a batch
+	simulation could compile this (e.g. with numba.njit) without touching the
+	interactive code.
+	"""
+	delta = (player_idx - wizard_idx) % 5
+	if delta == 0:
+		return 0
+	return 1 if delta == 2 or delta == 4 else -1
+
+
 class RedWizard(Encounter):
 	"""A spell battle with the Red Wizard using fantasy-themed spells."""
 
@@ -207,40 +95,58 @@ class RedWizard(Encounter):
 		"Earthquake": ["Fireball", "Wind Gust"],
 	}
 
-	choices = list(game_rules.keys())
+	choices = tuple(game_rules)
+
+	# each spell beats the ones two and four steps behind it in the cycle,
+	# so (player - wizard) % 5 lands in WIN_DELTAS on a player win
+	WIN_DELTAS = frozenset({2, 4})
+
+	# spell name -> position in the cycle, computed once
+	_IDX = {name: i for i, name in enumerate(choices)}
+
+	# numbered spell menu is fixed, so build it once
+	MENU = "\n".join(f"  {i}. {c}" for i, c in enumerate(choices, 1))
+
+	# full per-round prompt, emitted as a single constant block
+	_PROMPT_BLOCK = "\nChoose a spell:\n" + MENU + "\nEnter number (1-5): "
+
+	def __init__(self, seed=None):
+		# dedicated RNG for the wizard's casts; seedable for replays
+		self._rng = random.Random(seed)
 
 	def run_encounter(self) -> EncounterOutcome:
-		print("A Red Wizard blocks your path and challenges you to a spell battle!")
-		print("Cast the correct spell to vanquish the wizard; if he wins, you are banished from this castle.")
+		sys.stdout.write(
+			"A Red Wizard blocks your path and challenges you to a spell battle!\n"
+			"Cast the correct spell to vanquish the wizard; if he wins, you are banished from this castle.\n"
+		)
 
 		while True:
-			print("\nChoose a spell:")
-			for i, c in enumerate(self.choices, 1):
-				print(f"  {i}. {c}")
-			choice = input("Enter number (1-5): ").strip()
-			try:
-				idx = int(choice) - 1
-				if idx < 0 or idx >= len(self.choices):
-					raise ValueError
-			except ValueError:
+			choice = _prompt(self._PROMPT_BLOCK).strip()
+			# isdigit pre-check keeps typos off the exception path
+			idx = int(choice) - 1 if choice.isdigit() else -1
+			if idx < 0 or idx >= len(self.choices):
 				print("Invalid selection. Try again.")
 				continue
 
 			player = self.choices[idx]
-			wizard = random.choice(self.choices)
-			print(f"You cast {player}. The Red Wizard casts {wizard}.")
+			wizard = self._rng.choice(self.choices)
 
+			# accumulate the round's lines and emit them in one write
+			out = [f"You cast {player}. The Red Wizard casts {wizard}."]
 			if player == wizard:
-				print("The spells clash evenly — the duel continues.")
+				out.append("The spells clash evenly — the duel continues.")
+				sys.stdout.write("\n".join(out) + "\n")
 				continue
 
-			# player wins if wizard choice is in player's beaten list
-			if wizard in self.game_rules[player]:
-				print("Your spell overwhelms the Red Wizard — he is vanquished from this castle!")
-				return EncounterOutcome.CONTINUE
+			# player wins when the numeric duel comes out in their favor
+			if _duel(self._IDX[player], self._IDX[wizard]) == 1:
+				out.append("Your spell overwhelms the Red Wizard — he is vanquished from this castle!")
+				outcome = EncounterOutcome.CONTINUE
 			else:
-				print("The Red Wizard's spell overpowers you — you are banished from this castle.")
-				return EncounterOutcome.END
+				out.append("The Red Wizard's spell overpowers you — you are banished from this castle.")
+				outcome = EncounterOutcome.END
+			sys.stdout.write("\n".join(out) + "\n")
+			return outcome
 
 
 
@@ -260,60 +166,79 @@ class Room:
 		return self.encounter.run_encounter()
 
 
-# Prebuilt castle rooms using the DefaultEncounter
-castle_rooms = [
-	Room("Great Hall", DefaultEncounter()),
-	Room("Armory", DefaultEncounter()),
-	Room("North Tower", DefaultEncounter()),
-	Room("Library", DefaultEncounter()),
-	Room("Courtyard", DefaultEncounter()),
-	Room("Throne Room", DefaultEncounter()),
-]
+@functools.lru_cache(maxsize=1)
+def _castle_rooms():
+	"""Build the default room list on first use instead of at import time."""
+	# the default rooms share one DefaultEncounter; it is stateless beyond
+	# the generator reference, so one instance serves every room
+	default_enc = DefaultEncounter()
+	rooms = [
+		Room("Great Hall", default_enc),
+		Room("Armory", default_enc),
+		Room("North Tower", default_enc),
+		Room("Library", default_enc),
+		Room("Courtyard", default_enc),
+		Room("Throne Room", default_enc),
+	]
+
+	# a Treasure Room with a Treasure Encounter
+	rooms.append(Room("Treasure Room", TreasureEncounter()))
+
+	# “The Red Wizard’s Lair” with the Red Wizard Encounter
+	rooms.append(Room("The Red Wizard's Lair", RedWizard()))
 
-# add a Treasure Room with a Treasure Encounter to the rooms list
-castle_rooms.append(Room("Treasure Room", TreasureEncounter()))
+	return rooms
+
+@functools.lru_cache(maxsize=4)
+def _door_prompt(num_doors):
+	"""Return the (announce, prompt, error) strings for a num_doors corridor."""
+	return (
+		f"\nYou approach a corridor with {num_doors} closed doors.",
+		f"Select a door (1-{num_doors}): ",
+		f"Invalid selection. Enter a number between 1 and {num_doors}.",
+	)
 
-# create a room called “The Red Wizard’s Lair” with the Red Wizard Encounter and add it to the rooms list
-castle_rooms.append(Room("The Red Wizard's Lair", RedWizard()))
 
 class Castle:
 	"""Manage room selection and navigation for the castle.
 
-	- room_selector: RandomItemSelector initialized with the `castle_rooms` list
+	- room_selector: RandomItemSelector initialized with the default room list
 	"""
 
-	def __init__(self, rooms=None):
-		# default to the prebuilt castle_rooms if none provided
-		rooms = rooms if rooms is not None else castle_rooms
-		self.room_selector = RandomItemSelector(rooms)
+	def __init__(self, rooms=None, seed=None):
+		# default to the lazily built room list if none provided
+		rooms = rooms if rooms is not None else _castle_rooms()
+		self.room_selector = RandomItemSelector(rooms, seed=seed)
+		# dedicated RNG for door counts; seedable for replays
+		self._rng = random.Random(seed)
 
 	def select_door(self) -> int:
 		"""Randomly determine number of doors (2-4), prompt the user to choose one.
 
 		Returns the door number chosen (1-based).
 		"""
-		num_doors = random.randint(2, 4)
-		print(f"\nYou approach a corridor with {num_doors} closed doors.")
-		prompt = f"Select a door (1-{num_doors}): "
+		num_doors = self._rng.randint(2, 4)
+		announce, prompt, error = _door_prompt(num_doors)
+		print(announce)
 		while True:
-			choice = input(prompt).strip()
-			try:
+			choice = _prompt(prompt).strip()
+			# isdigit pre-check keeps typos off the exception path
+			if choice.isdigit():
 				val = int(choice)
 				if 1 <= val <= num_doors:
 					print(f"You open door {val}...\n")
 					return val
-			except ValueError:
-				pass
-			print(f"Invalid selection. Enter a number between 1 and {num_doors}.")
+			print(error)
 
 	def next_room(self) -> EncounterOutcome:
-		"""Select a door, pick a random room, announce it, visit it, and return outcome."""
-		self.select_door()
+		"""Pick a random room, prompt for a door, announce the room, and visit it."""
+		# confirm a room is available before asking the user to pick a door
 		room = self.room_selector.pull_random_item()
 		if room is None:
 			print("No rooms available.")
 			return EncounterOutcome.END
 
+		self.select_door()
 		print(f"You find yourself in the {room.name}.")
 		return room.visit_room()
 
@@ -327,9 +252,10 @@ class Castle:
 class Game:
 	"""High-level game manager that runs a play loop over a Castle instance."""
 
-	def __init__(self, rooms=None):
-		# rooms is expected to be a sequence (list/set) of Room objects
-		self.castle = Castle(rooms=rooms)
+	def __init__(self, rooms=None, seed=None):
+		# rooms is expected to be a sequence (list/set) of Room objects;
+		# a seed makes the whole exploration reproducible
+		self.castle = Castle(rooms=rooms, seed=seed)
 
 	def play_game(self):
 		"""Main game loop.
@@ -337,15 +263,17 @@ class Game:
 		Explains the objective, then repeatedly visits rooms until an END outcome.
 		After game over, prompts the user to explore a different castle.
 		"""
-		print("Welcome to the castle exploration game!")
-		print("Objective: Navigate the castle rooms and search for the treasure.\n")
+		sys.stdout.write(
+			"Welcome to the castle exploration game!\n"
+			"Objective: Navigate the castle rooms and search for the treasure.\n\n"
+		)
 
 		while True:
 			outcome = self.castle.next_room()
 			if outcome == EncounterOutcome.END:
 				self.castle.reset()
 				print("Game Over")
-				again = input("Would you like to explore a different castle? (y/n): ").strip().lower()
+				again = _prompt("Would you like to explore a different castle? (y/n): ").strip().lower()
 				if again.startswith("y"):
 					print("Starting a new exploration...\n")
 					continue
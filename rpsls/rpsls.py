@@ -1,4 +1,23 @@
 import random
+import sys
+
+# Prompt I/O bound once at import: input() re-resolves these attributes on
+# every call, and a helper is easy to monkey-patch for scripted runs
+_write = sys.stdout.write
+_flush = sys.stdout.flush
+_read = sys.stdin.readline
+
+def _prompt(msg):
+    """Write msg, flush, and return one line of input without its newline.
+
+    Raises EOFError on end of input, matching the built-in input().
+    """
+    _write(msg)
+    _flush()
+    line = _read()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
 # Game rules mapping: (winner, loser): reason
 RULES = {
@@ -14,41 +33,48 @@ RULES = {
     ('rock', 'scissors'): 'Rock crushes scissors',
 }
 
-CHOICES = ['rock', 'paper', 'scissors', 'lizard', 'spock']
+CHOICES = ('rock', 'paper', 'scissors', 'lizard', 'spock')
+
+# Display names capitalized once instead of on every print
+CHOICES_DISPLAY = tuple(c.capitalize() for c in CHOICES)
+
+# The choice menu never changes, so format it once at import time
+_MENU = "Choose one:\n" + "\n".join(f"{i}. {c}" for i, c in enumerate(CHOICES_DISPLAY, 1))
+
+# Valid menu entries as strings, so input validation is one set lookup with
+# no exception raised on a typo
+_VALID_CHOICE_STR = frozenset('12345')
+
+# Every ordered pair of choices mapped to its (result, reason) once at import,
+# so determine_winner is a single lookup with no branching
+OUTCOMES = {(c, c): ('tie', "It's a tie!") for c in CHOICES}
+for _pair, _reason in RULES.items():
+    OUTCOMES[_pair] = ('win', _reason)
+    OUTCOMES[(_pair[1], _pair[0])] = ('lose', _reason)
 
 def get_user_choice():
-    print("Choose one:")
-    for idx, choice in enumerate(CHOICES, 1):
-        print(f"{idx}. {choice.capitalize()}")
+    print(_MENU)
     while True:
-        try:
-            selection = int(input("Enter number (1-5): "))
-            if 1 <= selection <= 5:
-                return CHOICES[selection - 1]
-        except ValueError:
-            pass
+        selection = _prompt("Enter number (1-5): ").strip()
+        if selection in _VALID_CHOICE_STR:
+            idx = int(selection) - 1
+            return CHOICES[idx], idx
         print("Invalid input. Please try again.")
 
 def get_computer_choice():
-    return random.choice(CHOICES)
+    idx = random.randrange(len(CHOICES))
+    return CHOICES[idx], idx
 
 def determine_winner(user, computer):
-    if user == computer:
-        return 'tie', "It's a tie!"
-    elif (user, computer) in RULES:
-        return 'win', RULES[(user, computer)]
-    elif (computer, user) in RULES:
-        return 'lose', RULES[(computer, user)]
-    else:
-        return 'error', "Unexpected result."
+    return OUTCOMES.get((user, computer), ('error', "Unexpected result."))
 
 def main():
     print("Welcome to Rock Paper Scissors Lizard Spock!")
     while True:
-        user_choice = get_user_choice()
-        computer_choice = get_computer_choice()
-        print(f"\nYou chose: {user_choice.capitalize()}")
-        print(f"Computer chose: {computer_choice.capitalize()}")
+        user_choice, user_idx = get_user_choice()
+        computer_choice, computer_idx = get_computer_choice()
+        print(f"\nYou chose: {CHOICES_DISPLAY[user_idx]}")
+        print(f"Computer chose: {CHOICES_DISPLAY[computer_idx]}")
         result, reason = determine_winner(user_choice, computer_choice)
         print(reason)
         if result == 'win':
@@ -57,7 +83,7 @@ def main():
             print("You lose!\n")
         else:
             print("It's a tie!\n")
-        play_again = input("Play again? (y/n): ").strip().lower()
+        play_again = _prompt("Play again? (y/n): ").strip().lower()
         if play_again != 'y':
             print("Thanks for playing!")
             break
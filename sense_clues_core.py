@@ -0,0 +1,191 @@
+"""Adventure game clues.
+
+This module provides the small, reusable `clues` tuple shared by the adventure
+games. Each entry is a one-sentence hint about a past event and begins with
+"There is a...". The `RandomItemSelector` and `SenseClueGenerator` helpers
+that both adv_game variants use live here too, so the classes and data exist
+once per process instead of once per game module.
+"""
+import functools
+import random
+import sys
+
+# Prompt I/O bound once at import: input() re-resolves these attributes on
+# every call. A module-level helper is also easy to monkey-patch for
+# scripted or non-interactive runs.
+_write = sys.stdout.write
+_flush = sys.stdout.flush
+_read = sys.stdin.readline
+
+
+def _prompt(msg):
+	"""Write msg, flush, and return one line of input without its newline.
+
+	Raises EOFError on end of input, matching the built-in input().
+	"""
+	_write(msg)
+	_flush()
+	line = _read()
+	if not line:
+		raise EOFError
+	return line.rstrip("\n")
+
+
+clues = (
+	"There is a smudge of dried ink on the underside of the table.",
+	"There is a faint scorch on the carpet as if something hot had been placed there.",
+	"There is a single muddy footprint pressed into the rug's fringe.",
+	"There is a scrap of paper folded three times and tucked into the baseboard.",
+	"There is a whisper of perfume that doesn't match any occupant's clothing.",
+	"There is a hidden latch behind the bookshelf, its edges recently worn.",
+	"There is a streak of crimson along the windowsill that has dried a while.",
+	"There is a child's toy, intact but abandoned, under the radiator.",
+	"There is a calendar with one day circled and the ink smudged by a trembling hand.",
+	"There is a loose floorboard with a small hollow stamped into dust beneath it.",
+)
+
+sense_exp = (
+	"You see torchlight pooling along the flagstones, though no torch burns nearby.",
+	"You hear the slow turning of gears somewhere deep in the wall, patient and eternal.",
+	"You smell cold iron mixed with old beeswax and something floral that has lingered for years.",
+	"You feel the carved stone hum faintly beneath your fingertips, as if remembering a name.",
+	"You sense the room holding its breath, a quiet pressure that makes your heartbeat louder.",
+	"You see motes of dust dancing in a shaft of moonlight that slices through a narrow slit.",
+	"You hear a draped curtain stir though the air is still, like the echo of a passing cloak.",
+	"You smell smoke and melted wax threaded through the tapestry's weave.",
+	"You feel a chill run along the baseboard as if footsteps passed by moments ago.",
+	"You see a shadow pause in the corner, not quite matching the shape of anything known.",
+	"You hear a faint, off-key melody humming from behind a sealed door.",
+	"You sense something familiar and foreign at once, a memory that belongs to someone else.",
+)
+
+
+class RandomItemSelector:
+	"""Select random items without immediate repetition.
+
+	- items: list of available items (kept in insertion order)
+	- used_items: items already drawn this cycle (derived from indices, so
+	  duplicate values in the pool are tracked correctly)
+
+	Methods
+	- add_item(item): append a new item to the pool
+	- pull_random_item(): return a random unused item, mark it used; when all
+	  items have been used, the used list is cleared and selection resumes.
+	- reset(): clear the used_items list so all items are available again.
+	"""
+
+	def __init__(self, items=None, seed=None):
+		# store a shallow copy so external mutations don't affect internal state
+		self.items = list(items) if items else []
+		# dedicated RNG: skips the global random module's indirection and
+		# makes seeded runs reproducible
+		self._rng = random.Random(seed)
+		self._reshuffle()
+
+	def _reshuffle(self):
+		"""Build a fresh shuffled permutation of item indices and rewind the cursor."""
+		self._order = list(range(len(self.items)))
+		self._rng.shuffle(self._order)
+		self._pos = 0
+
+	def add_item(self, item):
+		"""Add a new item to the selection pool.
+
+		The item will be available immediately for selection unless it's already
+		present in the pool. Duplicates are allowed to support weighted selection.
+		"""
+		self.items.append(item)
+		# splice the new index into the unseen part of the permutation so it
+		# can still be drawn this cycle
+		self._order.insert(self._rng.randint(self._pos, len(self._order)), len(self.items) - 1)
+
+	def pull_random_item(self):
+		"""Return a random item that hasn't been used yet.
+
+		If all items have been used, reshuffle to allow reuse.
+		If there are no items at all, return None.
+		"""
+		if not self.items:
+			# Nothing to choose from
+			return None
+
+		if self._pos >= len(self._order):
+			# Every item has been drawn; start a fresh cycle
+			self._reshuffle()
+
+		choice = self.items[self._order[self._pos]]
+		self._pos += 1
+		return choice
+
+	@property
+	def used_items(self):
+		"""Items drawn so far this cycle, in draw order.
+
+		Materialized on demand from the drawn slice of the permutation; the
+		authoritative record of usage is the index cursor, so duplicate values
+		in the pool do not collide.
+		"""
+		return [self.items[i] for i in self._order[:self._pos]]
+
+	def is_exhausted(self):
+		"""Return True when every item in the current cycle has been drawn."""
+		return self._pos >= len(self._order)
+
+	def reset(self):
+		"""Make all items available for selection again by clearing used_items."""
+		self._reshuffle()
+
+
+class SenseClueGenerator:
+	"""Singleton generator that combines a clue and a sensory expression.
+
+	Uses two RandomItemSelector instances: one for `clues` and one for `sense_exp`.
+	The singleton is stored in the class variable `_instance`.
+	"""
+
+	_instance = None
+
+	def __new__(cls):
+		if cls._instance is None:
+			cls._instance = super().__new__(cls)
+
+			# Initialize selectors using the module-level tuples
+			cls._instance.clue_selector = RandomItemSelector(clues)
+			cls._instance.sense_selector = RandomItemSelector(sense_exp)
+
+			# Bind the pull methods once so get_senseclue skips two attribute
+			# lookups and method dispatches per call
+			cls._instance._pull_clue = cls._instance.clue_selector.pull_random_item
+			cls._instance._pull_sense = cls._instance.sense_selector.pull_random_item
+
+		return cls._instance
+
+	def get_senseclue(self):
+		"""Pull one clue and one sensory sentence and return them combined.
+
+		Example output: "You hear a curtain stir though the air is still. There is a scrap of paper..."
+		"""
+		clue = self._pull_clue()
+		sense = self._pull_sense()
+
+		if clue and sense:
+			return f"{sense} {clue}"
+		return clue or sense or ""
+
+	def pull_random_item(self):
+		"""Compatibility proxy: return the same combined string as `get_senseclue`.
+
+		This method exists so callers that expect a `pull_random_item` method can
+		call it directly on the generator instance.
+		"""
+		return self.get_senseclue()
+
+
+@functools.lru_cache(maxsize=1)
+def get_sense_clue_generator():
+	"""Return the shared SenseClueGenerator, creating it on first use.
+
+	Deferring construction keeps importing this module from building the two
+	selectors before any game actually needs them.
+	"""
+	return SenseClueGenerator()